@@ -6,10 +6,34 @@ to Markdown formatted tables.
 """
 
 import argparse
+import collections
 import csv
 import io
+import itertools
+import mmap
+import os
+import stat
 import sys
-from typing import IO, Union
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import (
+    IO,
+    AnyStr,
+    BinaryIO,
+    Deque,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# Number of bytes read from the input at a time
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# Inputs at least this large are formatted on a process pool
+PARALLEL_THRESHOLD = 16 * 1024 * 1024
+
+_ALL_BYTES = bytes(range(256))
 
 
 def read_csv_file(file_path_or_obj: Union[str, IO]) -> str:
@@ -26,14 +50,150 @@ def read_csv_file(file_path_or_obj: Union[str, IO]) -> str:
     """
     try:
         if isinstance(file_path_or_obj, str):
-            with open(file_path_or_obj, "r", encoding="utf-8") as f:
-                return f.read()
+            fd = os.open(file_path_or_obj, os.O_RDONLY)
+            try:
+                content = _read_fd(fd).decode("utf-8")
+            finally:
+                os.close(fd)
         else:
             return file_path_or_obj.read()
-    except Exception as e:
+    except (OSError, UnicodeDecodeError) as e:
+        raise IOError(f"Error occurred while reading CSV file: {e}")
+
+    if "\r" in content:
+        # Match the newline translation of a text-mode read
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _read_fd(fd: int) -> bytes:
+    """Reads a file descriptor to EOF, usually with a single read call."""
+    size = os.fstat(fd).st_size
+    parts = []
+    total = 0
+    while True:
+        part = os.read(fd, max(size - total, io.DEFAULT_BUFFER_SIZE))
+        if not part:
+            break
+        parts.append(part)
+        total += len(part)
+        # Regular files report their exact size, so no EOF read is needed
+        if size and total >= size:
+            break
+    return b"".join(parts)
+
+
+def map_csv_file(file_path: str) -> BinaryIO:
+    """Maps a CSV file into memory without copying it onto the Python heap.
+
+    Args:
+        file_path: CSV file path
+
+    Returns:
+        A read-only memory map for a non-empty regular file. Anything else,
+        such as a pipe, FIFO or procfs file, is returned as a binary file
+        object to be read as a stream.
+
+    Raises:
+        IOError: An error occurred reading the CSV file.
+    """
+    try:
+        f = open(file_path, "rb")
+        st = os.fstat(f.fileno())
+        # Non-regular files report a size of 0 and cannot be mapped
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            return f
+        with f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError as e:
         raise IOError(f"Error occurred while reading CSV file: {e}")
 
 
+def _fit_row(row: List[AnyStr], ncols: int, pad: List[AnyStr]) -> List[AnyStr]:
+    """Pads a row with empty cells from pad, or truncates it, to ncols cells."""
+    # Fill with empty strings if row is shorter than header
+    if len(row) < ncols:
+        row.extend(pad[len(row) :])
+        return row
+    # Truncate row if it's longer than header
+    return row[:ncols]
+
+
+def _iter_body(rows: Iterator[List[str]], ncols: int) -> Iterator[str]:
+    """Yields parsed data rows as Markdown, fitted to ncols cells."""
+    pad = [""] * ncols
+    for row in rows:
+        if len(row) != ncols:
+            row = _fit_row(row, ncols, pad)
+        yield f"| {' | '.join(row)} |"
+
+
+def _split_lines(text: str) -> List[str]:
+    """Splits text into lines at LF, CRLF and CR line endings only.
+
+    Unlike str.splitlines, characters such as form feed or the Unicode line
+    separator are kept as part of the cell they appear in.
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = text.split("\n")
+    # A trailing newline does not start another line
+    if lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+def _split_rows(lines: List[str], delimiter: str) -> Iterator[List[str]]:
+    """Splits unquoted lines into cells, taking the first line as the header.
+
+    Data rows are split at most once past the header width, which is enough
+    to detect and truncate long rows without splitting every extra cell.
+    """
+    it = iter(lines)
+    header = next(it, None)
+    if header is None:
+        return
+    # A blank header line has no columns, as with csv.reader
+    header_row = header.split(delimiter) if header else []
+    yield header_row
+    maxsplit = len(header_row)
+    for line in it:
+        yield line.split(delimiter, maxsplit)
+
+
+def iter_md_rows(csv_content: str, delimiter: str = ",") -> Iterator[str]:
+    """Yields the Markdown table for CSV content one line at a time.
+
+    Rows are parsed lazily, so only one parsed row is alive at a time.
+
+    Args:
+        csv_content: CSV formatted string
+        delimiter: CSV delimiter character
+
+    Yields:
+        The header row, the separator row, then each data row, without
+        trailing newlines. Empty CSV data yields a single notice line.
+    """
+    if '"' not in csv_content and delimiter != '"':
+        # No quoting, so a plain split yields the same fields as csv.reader
+        rows = _split_rows(_split_lines(csv_content), delimiter)
+    else:
+        # Process string as CSV; lines are re-terminated so that newlines
+        # inside quoted fields are kept
+        lines = [line + "\n" for line in _split_lines(csv_content)]
+        rows = csv.reader(lines, delimiter=delimiter)
+
+    header_row = next(rows, None)
+    if header_row is None:
+        yield "Empty CSV data."
+        return
+    ncols = len(header_row)
+
+    yield "| " + " | ".join(header_row) + " |"
+    yield "| " + " | ".join(["---"] * ncols) + " |"
+    yield from _iter_body(rows, ncols)
+
+
 def csv_to_md_table(csv_content: str, delimiter: str = ",") -> str:
     """Converts CSV string to Markdown table format.
 
@@ -44,37 +204,226 @@ def csv_to_md_table(csv_content: str, delimiter: str = ",") -> str:
     Returns:
         A string containing the Markdown formatted table.
     """
-    try:
-        # Process string as CSV
-        reader = csv.reader(io.StringIO(csv_content), delimiter=delimiter)
-        rows = list(reader)
+    return "\n".join(iter_md_rows(csv_content, delimiter=delimiter))
 
-        if not rows:
-            return "Empty CSV data."
 
-        # Store header row for reuse
-        header_row = rows[0]
+def iter_chunks(stream: BinaryIO, size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Reads a binary stream in blocks that end on a line boundary.
 
-        # Create header and separator rows
-        header = "| " + " | ".join(header_row) + " |"
-        separator = "| " + " | ".join(["---"] * len(header_row)) + " |"
+    Blocks end after the last LF of a read, or after the last CR when the
+    read has no LF, so CR-only files are streamed too. A CR at the very end
+    of a read is held back in case the next read starts with its LF.
 
-        data_rows = []
-        for row in rows[1:]:
-            # Fill with empty strings if row is shorter than header
-            if len(row) < len(header_row):
-                row.extend([""] * (len(header_row) - len(row)))
-            # Truncate row if it's longer than header
-            elif len(row) > len(header_row):
-                row = row[: len(header_row)]
-            data_rows.append("| " + " | ".join(row) + " |")
+    Args:
+        stream: Binary stream to read from
+        size: Number of bytes to read at a time
 
-        md_table = "\n".join([header, separator] + data_rows)
+    Yields:
+        Blocks of complete lines. Only the final block may lack a trailing
+        newline.
+    """
+    # Pieces of the incomplete last line, joined once its end is read
+    pending: List[bytes] = []
+    while True:
+        data = stream.read(size)
+        if not data:
+            if pending:
+                yield b"".join(pending)
+            return
+        cut = data.rfind(b"\n") + 1
+        if cut == 0:
+            cut = data.rfind(b"\r", 0, len(data) - 1) + 1
+        if cut == 0:
+            pending.append(data)
+            continue
+        pending.append(data[:cut])
+        yield b"".join(pending)
+        pending = [data[cut:]] if cut < len(data) else []
 
-        return md_table
 
-    except Exception as e:
-        return f"An error occurred: {e}"
+def _format_lines(lines: List[bytes], ncols: int, delimiter: bytes) -> bytes:
+    """Formats CSV lines as newline-terminated Markdown table rows."""
+    if not lines:
+        return b""
+
+    counts = list(map(bytes.count, lines, itertools.repeat(delimiter)))
+    if min(counts) == max(counts) == ncols - 1:
+        # Every row already has ncols cells, so the whole block can be
+        # rewritten by C-level join/replace without splitting out cells.
+        # Delimiters are replaced before the row separators are inserted,
+        # since a "|" or " " delimiter would otherwise match them too.
+        body = b"\n".join(lines)
+        if ncols > 1:
+            body = body.replace(delimiter, b" | ")
+        return b"| " + body.replace(b"\n", b" |\n| ") + b" |\n"
+
+    pad = [b""] * ncols
+    rows = []
+    for line, count in zip(lines, counts):
+        if count == ncols - 1:
+            # Delimiters were already located by count; replace them in place
+            rows.append(line.replace(delimiter, b" | "))
+            continue
+        row = _fit_row(line.split(delimiter, ncols), ncols, pad)
+        rows.append(b" | ".join(row))
+    return b"| " + b" |\n| ".join(rows) + b" |\n"
+
+
+def format_chunk(chunk: bytes, ncols: int, delimiter: bytes) -> bytes:
+    """Formats a block of unquoted CSV lines as Markdown table rows.
+
+    Args:
+        chunk: Complete CSV lines, as produced by iter_chunks
+        ncols: Number of columns in the header row
+        delimiter: Encoded CSV delimiter
+
+    Returns:
+        The Markdown table rows, each terminated by a newline.
+    """
+    if (
+        ncols
+        and len(delimiter) == 1
+        and delimiter != b"\n"
+        and b"\r" not in chunk
+    ):
+        body = chunk if chunk.endswith(b"\n") else chunk + b"\n"
+        # Dropping everything but delimiters and newlines leaves the shape of
+        # each row, so the widths of all rows are checked in one pass
+        other = _ALL_BYTES.replace(delimiter, b"").replace(b"\n", b"")
+        shape = body.translate(None, other)
+        if shape == (delimiter * (ncols - 1) + b"\n") * body.count(b"\n"):
+            cells = body[:-1].replace(delimiter, b" | ")
+            return b"| " + cells.replace(b"\n", b" |\n| ") + b" |\n"
+
+    return _format_lines(chunk.splitlines(), ncols, delimiter)
+
+
+def _md_head(header_row: List[bytes]) -> bytes:
+    """Formats the header and separator rows of a Markdown table."""
+    header = b"| " + b" | ".join(header_row) + b" |\n"
+    return header + b"| " + b" | ".join([b"---"] * len(header_row)) + b" |\n"
+
+
+def _split_first_line(chunk: bytes) -> Tuple[bytes, bytes]:
+    """Splits a chunk into its first line, without terminator, and the rest."""
+    end = chunk.find(b"\n") + 1 or len(chunk)
+    if b"\r" in chunk[:end]:
+        # A lone carriage return also ends a line
+        end = len(chunk.splitlines(keepends=True)[0])
+    return chunk[:end].rstrip(b"\r\n"), chunk[end:]
+
+
+def _write_quoted(
+    chunks: Iterator[bytes], out: BinaryIO, delimiter: str, ncols: Optional[int]
+) -> None:
+    """Writes the remaining chunks through csv.reader to honour quoting.
+
+    Line endings are translated to LF first, as a text-mode read would, so
+    newlines inside quoted cells come out the same for every input format.
+    """
+    lines = (
+        line.decode("utf-8")
+        for chunk in chunks
+        for line in chunk.replace(b"\r\n", b"\n")
+        .replace(b"\r", b"\n")
+        .splitlines(keepends=True)
+    )
+    reader = csv.reader(lines, delimiter=delimiter)
+
+    if ncols is None:
+        header_row = next(reader, None)
+        if header_row is None:
+            out.write(b"Empty CSV data.\n")
+            return
+        ncols = len(header_row)
+        out.write(_md_head([cell.encode("utf-8") for cell in header_row]))
+
+    out.writelines(f"{line}\n".encode("utf-8") for line in _iter_body(reader, ncols))
+
+
+def _stream_size(stream: BinaryIO) -> int:
+    """Returns the number of bytes left in a stream, or 0 if unknown."""
+    if isinstance(stream, mmap.mmap):
+        return len(stream) - stream.tell()
+    if stream.seekable():
+        pos = stream.tell()
+        end = stream.seek(0, io.SEEK_END)
+        stream.seek(pos)
+        return end - pos
+    return 0
+
+
+def write_md_table(
+    stream: BinaryIO,
+    out: BinaryIO,
+    delimiter: str = ",",
+    columns: Optional[int] = None,
+) -> None:
+    """Writes UTF-8 encoded CSV data to a binary stream as a Markdown table.
+
+    The input is processed in line-aligned chunks, so only a few chunks are
+    held in memory at a time. On multi-core machines, inputs of at least
+    PARALLEL_THRESHOLD bytes are formatted on a process pool, one chunk per
+    task. Cells are copied as bytes; data is only decoded once a chunk
+    contains quotes and has to go through csv.reader.
+
+    Args:
+        stream: Binary stream of UTF-8 encoded CSV data
+        out: Binary stream receiving the Markdown table
+        delimiter: CSV delimiter character
+        columns: Number of columns when the data has no header row. Every
+            row is then treated as data under a generated header of
+            col0, col1, ... up to col{columns - 1}.
+    """
+    delim = delimiter.encode("utf-8")
+    ncols = columns
+    if ncols is not None:
+        out.write(_md_head([b"col%d" % i for i in range(ncols)]))
+
+    workers = os.cpu_count() or 1
+    executor = None
+    if workers > 1 and _stream_size(stream) >= PARALLEL_THRESHOLD:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    chunks = iter_chunks(stream, CHUNK_SIZE)
+    pending: Deque[Future] = collections.deque()
+
+    try:
+        for chunk in chunks:
+            if delim == b'"' or b'"' in chunk:
+                for future in pending:
+                    out.write(future.result())
+                # Quoted fields may span lines, so csv.reader handles the rest
+                _write_quoted(
+                    itertools.chain([chunk], chunks), out, delimiter, ncols
+                )
+                return
+
+            if ncols is None:
+                # The header is taken from the first chunk, whose remaining
+                # lines are formatted like any other chunk
+                header, chunk = _split_first_line(chunk)
+                # A blank header line has no columns, as with csv.reader
+                header_row = header.split(delim) if header else []
+                ncols = len(header_row)
+                out.write(_md_head(header_row))
+                if chunk:
+                    out.write(format_chunk(chunk, ncols, delim))
+            elif executor is None:
+                out.write(format_chunk(chunk, ncols, delim))
+            else:
+                pending.append(executor.submit(format_chunk, chunk, ncols, delim))
+                # Bound the number of chunks in flight, writing in input order
+                if len(pending) > 2 * workers:
+                    out.write(pending.popleft().result())
+
+        for future in pending:
+            out.write(future.result())
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    if ncols is None:
+        out.write(b"Empty CSV data.\n")
 
 
 def main() -> None:
@@ -94,25 +443,52 @@ def main() -> None:
         default=",",
         help="CSV delimiter character (default: comma)",
     )
+    parser.add_argument(
+        "--columns",
+        type=int,
+        help="Number of columns when the input has no header row "
+        "(generates col0, col1, ... as the header)",
+    )
 
     args = parser.parse_args()
+    if args.columns is not None and args.columns < 1:
+        parser.error("--columns must be at least 1")
 
     try:
-        # Determine input source and read content
+        # Determine input source
         if args.input:
-            csv_content = read_csv_file(args.input)
+            stream = map_csv_file(args.input)
+        elif hasattr(sys.stdin, "buffer"):
+            stream = sys.stdin.buffer
         else:
-            csv_content = read_csv_file(sys.stdin)
+            # stdin has been replaced by a text-only stream
+            stream = io.BytesIO(read_csv_file(sys.stdin).encode("utf-8"))
 
-        # Convert CSV to Markdown table
-        md_table = csv_to_md_table(csv_content, delimiter=args.delimiter)
-
-        # Determine output destination
-        if args.output:
-            with open(args.output, "w", encoding="utf-8") as f:
-                f.write(md_table)
-        else:
-            print(md_table)
+        try:
+            # Convert CSV to Markdown table and write it to the destination
+            if args.output:
+                with open(args.output, "wb") as f:
+                    write_md_table(
+                        stream, f, delimiter=args.delimiter, columns=args.columns
+                    )
+            elif hasattr(sys.stdout, "buffer"):
+                write_md_table(
+                    stream,
+                    sys.stdout.buffer,
+                    delimiter=args.delimiter,
+                    columns=args.columns,
+                )
+            else:
+                # stdout has been replaced by a text-only stream
+                buf = io.BytesIO()
+                write_md_table(
+                    stream, buf, delimiter=args.delimiter, columns=args.columns
+                )
+                sys.stdout.write(buf.getvalue().decode("utf-8"))
+        finally:
+            # Close the input opened here, but leave stdin alone
+            if args.input:
+                stream.close()
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
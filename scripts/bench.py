@@ -0,0 +1,104 @@
+#!/usr/bin/env -S uv run --script
+"""Benchmark for csv2md over synthetic CSV data.
+
+Times csv_to_md_table on an in-memory string and write_md_table on a
+temporary file for each requested size, and prints the throughput.
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv2md
+
+MB = 1024 * 1024
+
+
+def make_csv(size: int) -> bytes:
+    """Generates CSV data of roughly the given size in bytes.
+
+    Args:
+        size: Target size in bytes
+
+    Returns:
+        UTF-8 encoded CSV data with a header row and four columns.
+    """
+    header = b"id,name,city,score\n"
+    block = b"".join(
+        b"%d,user%d,Tokyo,%d.%d\n" % (i, i, i % 100, i % 10) for i in range(10000)
+    )
+    repeat = max(1, (size - len(header)) // len(block) + 1)
+    return (header + block * repeat)[:size].rpartition(b"\n")[0] + b"\n"
+
+
+def best_of(func: Callable[[], None], repeat: int) -> float:
+    """Returns the fastest of several timed runs of func, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def parse_sizes(value: str) -> List[int]:
+    """Parses a comma-separated list of sizes in MB."""
+    return [int(size) for size in value.split(",")]
+
+
+def main() -> None:
+    """Main entry point for the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark csv2md throughput.")
+    parser.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        default=[1, 100],
+        help="Comma-separated input sizes in MB (default: 1,100; "
+        "add 1000 for a 1 GB run)",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of runs per measurement; the fastest is reported",
+    )
+    args = parser.parse_args()
+
+    print(f"{'size':>8} {'function':<16} {'time (s)':>10} {'MB/s':>10}")
+    for size_mb in args.sizes:
+        data = make_csv(size_mb * MB)
+        csv_content = data.decode("utf-8")
+        elapsed = best_of(lambda: csv2md.csv_to_md_table(csv_content), args.repeat)
+        print(
+            f"{size_mb:>6}MB {'csv_to_md_table':<16} "
+            f"{elapsed:>10.3f} {len(data) / MB / elapsed:>10.1f}"
+        )
+        del csv_content
+
+        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as tmp:
+            tmp.write(data)
+            tmp_path = tmp.name
+        del data
+
+        def run_file() -> None:
+            with open(tmp_path, "rb") as f:
+                csv2md.write_md_table(f, io.BytesIO())
+
+        try:
+            elapsed = best_of(run_file, args.repeat)
+            print(
+                f"{size_mb:>6}MB {'write_md_table':<16} "
+                f"{elapsed:>10.3f} {os.path.getsize(tmp_path) / MB / elapsed:>10.1f}"
+            )
+        finally:
+            os.unlink(tmp_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,11 @@
 import os
 import sys
 import tempfile
+import threading
 import unittest
 from contextlib import redirect_stdout, redirect_stderr
-from io import StringIO
+from io import BytesIO, StringIO
+from unittest.mock import patch
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import csv2md
@@ -50,6 +52,150 @@ class TestCSVToMarkdownTable(unittest.TestCase):
         result = csv2md.csv_to_md_table(csv_content, delimiter=";")
         self.assertEqual(result, expected)
 
+    def test_csv_to_md_table_form_feed_in_cell(self) -> None:
+        """Tests that only LF, CRLF and CR end a line."""
+        csv_content = "h1,h2\na\x0cb,c\r\nd\u2028e,f\rg,h\n"
+        expected = (
+            "| h1 | h2 |\n| --- | --- |\n| a\x0cb | c |\n| d\u2028e | f |\n| g | h |"
+        )
+        result = csv2md.csv_to_md_table(csv_content)
+        self.assertEqual(result, expected)
+
+    def test_blank_header_line(self) -> None:
+        """Tests that a blank first line gives a header with no columns."""
+        expected = "|  |\n|  |\n|  |\n|  |"
+        for csv_content in ("\na,b\n1,2\n", '\n"a",b\n1,2\n'):
+            self.assertEqual(csv2md.csv_to_md_table(csv_content), expected)
+
+            out = BytesIO()
+            csv2md.write_md_table(BytesIO(csv_content.encode("utf-8")), out)
+            self.assertEqual(out.getvalue().decode("utf-8"), expected + "\n")
+
+    def test_csv_to_md_table_quoted_fields(self) -> None:
+        """Tests conversion with quoted fields containing delimiters."""
+        csv_content = 'Name,City\nJohn,"New York, NY"'
+        expected = "| Name | City |\n| --- | --- |\n| John | New York, NY |"
+        result = csv2md.csv_to_md_table(csv_content)
+        self.assertEqual(result, expected)
+
+    def test_csv_to_md_table_quoted_newline(self) -> None:
+        """Tests that newlines inside quoted fields are preserved."""
+        csv_content = 'Name,Note\nJohn,"a\nb"\nJane,c'
+        expected = "| Name | Note |\n| --- | --- |\n| John | a\nb |\n| Jane | c |"
+        result = csv2md.csv_to_md_table(csv_content)
+        self.assertEqual(result, expected)
+
+    def test_csv_to_md_table_quoted_line_separator(self) -> None:
+        """Tests that a Unicode line separator does not end a quoted row."""
+        csv_content = 'h1,h2\n"q",a\u2028b,c'
+        expected = "| h1 | h2 |\n| --- | --- |\n| q | a\u2028b |"
+        result = csv2md.csv_to_md_table(csv_content)
+        self.assertEqual(result, expected)
+
+    def test_iter_md_rows(self) -> None:
+        """Tests that Markdown lines are yielded one row at a time."""
+        csv_content = "Name,Age\nJohn,30\nJane"
+        expected = ["| Name | Age |", "| --- | --- |", "| John | 30 |", "| Jane |  |"]
+        result = list(csv2md.iter_md_rows(csv_content))
+        self.assertEqual(result, expected)
+
+    def test_write_md_table_bytes(self) -> None:
+        """Tests writing a Markdown table from UTF-8 encoded CSV data."""
+        csv_data = BytesIO("Name,City\nJosé,Zürich,CH\nJane".encode("utf-8"))
+        expected = "| Name | City |\n| --- | --- |\n| José | Zürich |\n| Jane |  |\n"
+        out = BytesIO()
+        csv2md.write_md_table(csv_data, out)
+        self.assertEqual(out.getvalue().decode("utf-8"), expected)
+
+    def test_iter_chunks_line_aligned(self) -> None:
+        """Tests that chunks end on line boundaries."""
+        stream = BytesIO(b"a,b\nlonger,line\nc,d")
+        chunks = list(csv2md.iter_chunks(stream, size=6))
+        self.assertEqual(chunks, [b"a,b\n", b"longer,line\n", b"c,d"])
+
+    def test_iter_chunks_cr_line_endings(self) -> None:
+        """Tests that CR-only input is cut at CR without splitting CRLF."""
+        stream = BytesIO(b"a,b\rc,d\re,f\r\ng,h")
+        chunks = list(csv2md.iter_chunks(stream, size=6))
+        self.assertEqual(chunks, [b"a,b\r", b"c,d\r", b"e,f\r\n", b"g,h"])
+
+    def test_write_md_table_quoted_after_first_chunk(self) -> None:
+        """Tests falling back to csv.reader for quotes in a later chunk."""
+        stream = BytesIO(b'Name,Note\nJohn,x\nJane,"a\nb,c"\n')
+        expected = b"| Name | Note |\n| --- | --- |\n| John | x |\n| Jane | a\nb,c |\n"
+        out = BytesIO()
+        with patch.object(csv2md, "CHUNK_SIZE", 8):
+            csv2md.write_md_table(stream, out)
+        self.assertEqual(out.getvalue(), expected)
+
+    def test_format_chunk(self) -> None:
+        """Tests formatting of uniform and ragged blocks of lines."""
+        self.assertEqual(
+            csv2md.format_chunk(b"a,b\r\nc,d\r\n", 2, b","),
+            b"| a | b |\n| c | d |\n",
+        )
+        self.assertEqual(
+            csv2md.format_chunk(b"a\nb,c,d\n", 2, b","),
+            b"| a |  |\n| b | c |\n",
+        )
+        self.assertEqual(
+            csv2md.format_chunk(b"a;b\nc;d", 2, b";"),
+            b"| a | b |\n| c | d |\n",
+        )
+
+    def test_write_md_table_quoted_crlf(self) -> None:
+        """Tests that CRLF inside a quoted cell is written as LF."""
+        stream = BytesIO(b'Name,Note\r\nJohn,"a\r\nb"\r\n')
+        expected = b"| Name | Note |\n| --- | --- |\n| John | a\nb |\n"
+        out = BytesIO()
+        csv2md.write_md_table(stream, out)
+        self.assertEqual(out.getvalue(), expected)
+
+    def test_format_chunk_pipe_and_space_delimiters(self) -> None:
+        """Tests delimiters that also appear in the Markdown row syntax."""
+        self.assertEqual(
+            csv2md.format_chunk(b"1|2|3\r\n4|5|6\r\n", 3, b"|"),
+            b"| 1 | 2 | 3 |\n| 4 | 5 | 6 |\n",
+        )
+        self.assertEqual(
+            csv2md.format_chunk(b"1 2 3\r\n4 5 6\r\n", 3, b" "),
+            b"| 1 | 2 | 3 |\n| 4 | 5 | 6 |\n",
+        )
+
+    def test_write_md_table_parallel(self) -> None:
+        """Tests that formatting on a process pool preserves row order."""
+        csv_data = b"id,value\n" + b"".join(b"%d,v%d\n" % (i, i) for i in range(200))
+        expected = BytesIO()
+        csv2md.write_md_table(BytesIO(csv_data), expected)
+
+        out = BytesIO()
+        with patch.object(csv2md, "CHUNK_SIZE", 64), patch.object(
+            csv2md, "PARALLEL_THRESHOLD", 0
+        ), patch.object(csv2md.os, "cpu_count", return_value=2):
+            csv2md.write_md_table(BytesIO(csv_data), out)
+        self.assertEqual(out.getvalue(), expected.getvalue())
+
+    def test_write_md_table_columns(self) -> None:
+        """Tests treating every row as data under a generated header."""
+        stream = BytesIO(b"John,30\nJane")
+        expected = b"| col0 | col1 |\n| --- | --- |\n| John | 30 |\n| Jane |  |\n"
+        out = BytesIO()
+        csv2md.write_md_table(stream, out, columns=2)
+        self.assertEqual(out.getvalue(), expected)
+
+    def test_map_csv_file(self) -> None:
+        """Tests memory-mapping CSV content from file path."""
+        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
+            tmp.write("Name,Age,City\nJohn,30,New York")
+            tmp_path = tmp.name
+
+        try:
+            csv_data = csv2md.map_csv_file(tmp_path)
+            self.assertEqual(csv_data[:], b"Name,Age,City\nJohn,30,New York")
+            csv_data.close()
+        finally:
+            os.unlink(tmp_path)
+
     def test_read_csv_file_from_string(self) -> None:
         """Tests reading CSV content from file path."""
         with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
@@ -62,6 +208,18 @@ class TestCSVToMarkdownTable(unittest.TestCase):
         finally:
             os.unlink(tmp_path)
 
+    def test_read_csv_file_crlf(self) -> None:
+        """Tests that CRLF line endings are translated when reading a path."""
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as tmp:
+            tmp.write(b"Name,Age\r\nJohn,30\r\n")
+            tmp_path = tmp.name
+
+        try:
+            content = csv2md.read_csv_file(tmp_path)
+            self.assertEqual(content, "Name,Age\nJohn,30\n")
+        finally:
+            os.unlink(tmp_path)
+
     def test_read_csv_file_from_file_object(self) -> None:
         """Tests reading CSV content from file object."""
         file_obj = StringIO("Name,Age,City\nJohn,30,New York")
@@ -89,6 +247,47 @@ class TestCSVToMarkdownTable(unittest.TestCase):
         finally:
             os.unlink(tmp_path)
 
+    def test_main_function_stdin_to_stdout(self) -> None:
+        """Tests main function with stdin input to stdout."""
+        stdout_capture = StringIO()
+        stdin = StringIO("Name,Age,City\nJohn,30,New York")
+        with redirect_stdout(stdout_capture), patch.object(sys, "stdin", stdin):
+            sys.argv = ["csv2md.py"]
+            csv2md.main()
+
+        output = stdout_capture.getvalue().strip()
+        expected = "| Name | Age | City |\n| --- | --- | --- |\n| John | 30 | New York |"
+        self.assertEqual(output, expected)
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "requires named pipes")
+    def test_main_function_fifo_to_stdout(self) -> None:
+        """Tests main function with a FIFO path, which reports a size of 0."""
+        tmp_dir = tempfile.mkdtemp()
+        fifo_path = os.path.join(tmp_dir, "input.csv")
+        os.mkfifo(fifo_path)
+
+        def feed() -> None:
+            with open(fifo_path, "w") as f:
+                f.write("Name,Age,City\nJohn,30,New York")
+
+        writer = threading.Thread(target=feed)
+        writer.start()
+        try:
+            stdout_capture = StringIO()
+            with redirect_stdout(stdout_capture):
+                sys.argv = ["csv2md.py", fifo_path]
+                csv2md.main()
+
+            output = stdout_capture.getvalue().strip()
+            expected = (
+                "| Name | Age | City |\n| --- | --- | --- |\n| John | 30 | New York |"
+            )
+            self.assertEqual(output, expected)
+        finally:
+            writer.join()
+            os.unlink(fifo_path)
+            os.rmdir(tmp_dir)
+
     def test_main_function_file_to_file(self) -> None:
         """Tests main function with file input to file output."""
         with tempfile.NamedTemporaryFile(mode="w+", delete=False) as input_tmp: